@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
 
 import argparse
+import errno
+import json
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Protocol, Set, Tuple
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # inotify is optional; fall back to polling
+    INotify = None
+    inotify_flags = None
+
+
+DEFAULT_STATUS_FILE = ".helm-scan-status.json"
 
 
 def run_scan(chart_path: Path, timeout: int) -> int:
@@ -38,6 +53,343 @@ def run_rename(root_path: Path) -> int:
     return subprocess.call(cmd)
 
 
+def find_charts(root_path: Path) -> List[Path]:
+    charts: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        if "Chart.yaml" in filenames:
+            charts.append(Path(dirpath))
+            # Subcharts under charts/ only render with the parent's values;
+            # charts_for_paths maps their edits back to this chart.
+            dirnames[:] = []
+    return charts
+
+
+def snapshot_files(root_path: Path) -> Dict[str, Tuple[int, int]]:
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[file_path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+def charts_for_paths(changed_paths: Set[str], charts: List[Path]) -> Set[Path]:
+    # A file belongs to every chart above it, so an edit to a subchart under
+    # charts/ also re-scans the parent chart that renders it.
+    affected: Set[Path] = set()
+    for changed in changed_paths:
+        changed_path = Path(changed)
+        for chart in charts:
+            if changed_path == chart or chart in changed_path.parents:
+                affected.add(chart)
+    return affected
+
+
+class Watcher(Protocol):
+    def poll(self) -> Set[str]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class PollingWatcher:
+    def __init__(self, root_path: Path, interval: float) -> None:
+        self.root_path = root_path
+        self.interval = interval
+        self.snapshot = snapshot_files(root_path)
+
+    def poll(self) -> Set[str]:
+        time.sleep(self.interval)
+        current = snapshot_files(self.root_path)
+        changed = {
+            path
+            for path in set(self.snapshot) | set(current)
+            if self.snapshot.get(path) != current.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    def __init__(self, root_path: Path, interval: float) -> None:
+        self.interval = interval
+        self.inotify = INotify()
+        self.mask = (
+            inotify_flags.CREATE
+            | inotify_flags.MODIFY
+            | inotify_flags.CLOSE_WRITE
+            | inotify_flags.DELETE
+            | inotify_flags.MOVED_FROM
+            | inotify_flags.MOVED_TO
+        )
+        self.watch_dirs: Dict[int, str] = {}
+        try:
+            self._add_tree(str(root_path), strict=True)
+        except OSError:
+            self.inotify.close()
+            raise
+
+    def _add_tree(self, top: str, strict: bool = False) -> None:
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            try:
+                wd = self.inotify.add_watch(dirpath, self.mask)
+            except OSError as exc:
+                if exc.errno == errno.ENOENT:
+                    continue
+                # Hitting fs.inotify.max_user_watches (ENOSPC) at startup would
+                # leave part of the tree unwatched; let create_watcher fall back.
+                if strict:
+                    raise
+                print(f"[WARN] Cannot watch {dirpath} ({exc}); changes there will be missed")
+                continue
+            self.watch_dirs[wd] = dirpath
+
+    def _remove_tree(self, top: str) -> None:
+        prefix = top + os.sep
+        for wd, dirpath in list(self.watch_dirs.items()):
+            if dirpath == top or dirpath.startswith(prefix):
+                del self.watch_dirs[wd]
+                try:
+                    self.inotify.rm_watch(wd)
+                except OSError:
+                    pass
+
+    def poll(self) -> Set[str]:
+        changed: Set[str] = set()
+        for event in self.inotify.read(timeout=int(self.interval * 1000)):
+            if event.mask & inotify_flags.IGNORED:
+                self.watch_dirs.pop(event.wd, None)
+                continue
+            parent = self.watch_dirs.get(event.wd)
+            if parent is None or not event.name:
+                continue
+            path = os.path.join(parent, event.name)
+            if event.mask & inotify_flags.ISDIR:
+                if event.name.startswith("."):
+                    continue
+                # A moved-away directory keeps its watches but would report
+                # events under the old path, so drop them; MOVED_TO re-adds.
+                if event.mask & inotify_flags.MOVED_FROM:
+                    self._remove_tree(path)
+                elif event.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO):
+                    self._add_tree(path)
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        self.inotify.close()
+
+
+def create_watcher(root_path: Path, interval: float, force_polling: bool) -> Watcher:
+    if INotify is not None and not force_polling:
+        try:
+            return InotifyWatcher(root_path, interval)
+        except OSError as exc:
+            print(f"[WARN] inotify unavailable ({exc}); falling back to polling")
+    return PollingWatcher(root_path, interval)
+
+
+def wait_for_changes(watcher: Watcher, debounce: float) -> Set[str]:
+    changed = watcher.poll()
+    if not changed:
+        return changed
+    # Keep collecting until the tree has been quiet for `debounce` seconds, so
+    # an editor save or a git checkout triggers a single re-scan.
+    deadline = time.monotonic() + debounce
+    while time.monotonic() < deadline:
+        more = watcher.poll()
+        if more:
+            changed |= more
+            deadline = time.monotonic() + debounce
+    return changed
+
+
+def check_images_cached(
+    images: List[str],
+    cache: Dict[str, dict],
+    cache_ttl: int,
+    timeout: int,
+) -> List[dict]:
+    from scan_helm_images import check_image, split_repository_and_tag
+
+    results: List[dict] = []
+    now = time.time()
+    for img in images:
+        try:
+            repository, tag = split_repository_and_tag(img)
+        except ValueError as ve:
+            results.append({"image": img, "status": "SKIP", "detail": str(ve)})
+            continue
+
+        cached = cache.get(img)
+        if cached is None or now - cached["checked_at"] > cache_ttl:
+            try:
+                exists, raw = check_image(repository, tag, timeout)
+            except OSError as exc:
+                exists, raw = False, f"[ERROR] {exc}"
+            cached = {"exists": exists, "detail": raw, "checked_at": time.time()}
+            # check_docker_tag.py also prints "missing" after token, network
+            # and 5xx failures; only a bare verdict is safe to cache.
+            if raw in ("exists", "missing"):
+                cache[img] = cached
+            else:
+                results.append(
+                    {
+                        "image": img,
+                        "status": "ERROR",
+                        "detail": raw,
+                        "checked_at": cached["checked_at"],
+                    }
+                )
+                continue
+
+        results.append(
+            {
+                "image": img,
+                "status": "OK" if cached["exists"] else "MISSING",
+                "detail": cached["detail"],
+                "checked_at": cached["checked_at"],
+            }
+        )
+    return results
+
+
+def scan_chart_cached(
+    chart_path: Path,
+    cache: Dict[str, dict],
+    cache_ttl: int,
+    timeout: int,
+) -> dict:
+    from scan_helm_images import extract_images_from_yaml, render_chart_to_yaml
+
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".yaml")
+    yaml_out_path = Path(temp_file.name)
+    temp_file.close()
+    try:
+        render_chart_to_yaml(chart_path, yaml_out_path)
+        images = extract_images_from_yaml(yaml_out_path.read_text())
+    except RuntimeError as exc:
+        return {"status": "ERROR", "error": str(exc), "images": [], "scanned_at": time.time()}
+    finally:
+        try:
+            os.unlink(str(yaml_out_path))
+        except Exception:
+            pass
+
+    results = check_images_cached(images, cache, cache_ttl, timeout)
+    statuses = {r["status"] for r in results}
+    if "MISSING" in statuses:
+        status = "MISSING"
+    elif "ERROR" in statuses:
+        status = "ERROR"
+    else:
+        status = "OK"
+    return {
+        "status": status,
+        "images": results,
+        "scanned_at": time.time(),
+    }
+
+
+def expired_charts(charts_status: Dict[str, dict], cache_ttl: int, now: float) -> Set[Path]:
+    return {
+        Path(chart)
+        for chart, result in charts_status.items()
+        if now - result["scanned_at"] > cache_ttl
+    }
+
+
+def write_status(status_path: Path, charts_status: Dict[str, dict]) -> None:
+    payload = {"updated_at": time.time(), "charts": charts_status}
+    tmp_path = status_path.with_name(status_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    os.replace(str(tmp_path), str(status_path))
+
+
+def run_watch(
+    root_path: Path,
+    status_path: Path,
+    timeout: int,
+    debounce: float,
+    interval: float,
+    cache_ttl: int,
+    force_polling: bool,
+) -> int:
+    cache: Dict[str, dict] = {}
+    charts_status: Dict[str, dict] = {}
+    own_files = {str(status_path), str(status_path) + ".tmp"}
+
+    def rescan(targets: Set[Path]) -> None:
+        for chart in sorted(targets):
+            print(f"[STEP] Scanning images under chart: {chart}")
+            try:
+                result = scan_chart_cached(chart, cache, cache_ttl, timeout)
+            except Exception as exc:
+                result = {"status": "ERROR", "error": str(exc), "images": [], "scanned_at": time.time()}
+            charts_status[str(chart)] = result
+            print(f"[INFO] {chart} -> {result['status']}")
+        save_status()
+
+    def save_status() -> None:
+        try:
+            write_status(status_path, charts_status)
+        except OSError as exc:
+            print(f"[ERROR] Failed to write status file {status_path}: {exc}")
+            return
+        print(f"[INFO] Status written to: {status_path}")
+
+    if shutil.which("helm") is None:
+        print("[ERROR] helm was not found on PATH")
+        return 2
+    try:
+        import scan_helm_images  # noqa: F401
+    except ImportError as exc:
+        print(f"[ERROR] Cannot import scan_helm_images.py: {exc}")
+        return 2
+
+    charts = find_charts(root_path)
+    print(f"[INFO] Found {len(charts)} chart(s) under: {root_path}")
+    watcher = create_watcher(root_path, interval, force_polling)
+    print(f"[INFO] Watching with {type(watcher).__name__}. Press Ctrl+C to stop.")
+
+    try:
+        rescan(set(charts))
+        while True:
+            changed = wait_for_changes(watcher, debounce) - own_files
+            if not changed:
+                # Charts nobody edits are re-scanned once their results age
+                # past the TTL, so the status file never serves stale checks.
+                stale = expired_charts(charts_status, cache_ttl, time.time())
+                if stale:
+                    rescan(stale)
+                continue
+            charts = find_charts(root_path)
+            known = {str(c) for c in charts}
+            for removed in set(charts_status) - known:
+                del charts_status[removed]
+            targets = charts_for_paths(changed, charts)
+            if targets:
+                rescan(targets)
+            else:
+                save_status()
+    except KeyboardInterrupt:
+        print("[INFO] Watch stopped.")
+    finally:
+        watcher.close()
+    return 0
+
+
 def main(argv: List[str]) -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -47,14 +399,38 @@ def main(argv: List[str]) -> int:
     )
     parser.add_argument("path", help="Path to the Helm chart directory to scan and the root path to rename under")
     parser.add_argument("--timeout", type=int, default=15, help="HTTP timeout in seconds for Docker Hub checks (default: 15)")
+    parser.add_argument("--watch", action="store_true", help="Watch every chart under path and re-scan changed charts continuously (no rename)")
+    parser.add_argument("--status-file", default=None, help=f"Where --watch writes scan results as JSON (default: <path>/{DEFAULT_STATUS_FILE})")
+    parser.add_argument("--debounce", type=float, default=1.0, help="Seconds of quiet before a change triggers a re-scan (default: 1.0)")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between file-system polls in --watch mode (default: 1.0)")
+    parser.add_argument("--cache-ttl", type=int, default=3600, help="Seconds an image check or chart result stays valid in --watch mode; expired charts are re-scanned even without edits (default: 3600)")
+    parser.add_argument("--polling", action="store_true", help="Force polling instead of inotify in --watch mode")
 
     args = parser.parse_args(argv)
+    if args.debounce < 0:
+        parser.error("--debounce must be non-negative")
+    if args.poll_interval <= 0:
+        parser.error("--poll-interval must be positive")
+    if args.cache_ttl <= 0:
+        parser.error("--cache-ttl must be positive")
 
     chart_path = Path(args.path).resolve()
     if not chart_path.exists() or not chart_path.is_dir():
         print(f"[ERROR] Path does not exist or is not a directory: {chart_path}")
         return 2
 
+    if args.watch:
+        status_path = Path(args.status_file).resolve() if args.status_file else chart_path / DEFAULT_STATUS_FILE
+        return run_watch(
+            chart_path,
+            status_path,
+            args.timeout,
+            args.debounce,
+            args.poll_interval,
+            args.cache_ttl,
+            args.polling,
+        )
+
     print(f"[STEP] Scanning images under chart: {chart_path}")
     scan_rc = run_scan(chart_path, args.timeout)
     print(f"[INFO] scan_helm_images.py exit code: {scan_rc}")
@@ -0,0 +1,142 @@
+import sys
+import types
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+import scan_then_rename
+
+
+def _make_chart(path: Path) -> Path:
+    path.mkdir(parents=True)
+    (path / "Chart.yaml").write_text("name: test\n")
+    return path
+
+
+def _split_repository_and_tag(image: str):
+    if "@" in image:
+        raise ValueError(f"Image is a digest, not a tag: {image}")
+    return tuple(image.rsplit(":", 1)) if ":" in image else (image, "latest")
+
+
+@pytest.fixture
+def fake_checks(monkeypatch):
+    """Replace scan_helm_images with a stub that records Docker Hub checks."""
+    calls = []
+    verdicts = {}
+
+    def check_image(repository: str, tag: str, timeout: int):
+        calls.append(f"{repository}:{tag}")
+        raw = verdicts.get(f"{repository}:{tag}", "exists")
+        return raw == "exists", raw
+
+    module = types.ModuleType("scan_helm_images")
+    module.check_image = check_image
+    module.split_repository_and_tag = _split_repository_and_tag
+    monkeypatch.setitem(sys.modules, "scan_helm_images", module)
+    return calls, verdicts
+
+
+def test_find_charts_skips_subcharts(tmp_path):
+    parent = _make_chart(tmp_path / "parent")
+    _make_chart(parent / "charts" / "sub")
+    other = _make_chart(tmp_path / "other")
+    _make_chart(tmp_path / ".git" / "hidden")
+
+    assert scan_then_rename.find_charts(tmp_path) == [other, parent]
+
+
+def test_charts_for_paths_maps_subchart_edit_to_parent(tmp_path):
+    parent = tmp_path / "parent"
+    other = tmp_path / "other"
+    changed = {str(parent / "charts" / "sub" / "values.yaml")}
+
+    assert scan_then_rename.charts_for_paths(changed, [parent, other]) == {parent}
+    assert scan_then_rename.charts_for_paths({str(tmp_path / "README.md")}, [parent, other]) == set()
+
+
+def test_snapshot_files_includes_dotfiles_but_not_hidden_dirs(tmp_path):
+    chart = _make_chart(tmp_path / "chart")
+    (chart / ".helmignore").write_text("*.bak\n")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref\n")
+
+    snapshot = scan_then_rename.snapshot_files(tmp_path)
+    assert str(chart / ".helmignore") in snapshot
+    assert str(tmp_path / ".git" / "HEAD") not in snapshot
+
+
+class _ScriptedWatcher:
+    def __init__(self, batches) -> None:
+        self.batches = list(batches)
+
+    def poll(self) -> Set[str]:
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self) -> None:
+        pass
+
+
+def test_wait_for_changes_merges_burst():
+    watcher = _ScriptedWatcher([{"a"}, {"b"}, set(), set()])
+    assert scan_then_rename.wait_for_changes(watcher, debounce=0.05) == {"a", "b"}
+
+
+def test_wait_for_changes_returns_empty_when_idle():
+    watcher = _ScriptedWatcher([])
+    assert scan_then_rename.wait_for_changes(watcher, debounce=0.05) == set()
+
+
+def test_check_images_cached_hits_cache(fake_checks):
+    calls, verdicts = fake_checks
+    verdicts["nginx:1.25"] = "missing"
+    cache = {}
+
+    first = scan_then_rename.check_images_cached(["nginx:1.25", "redis:7"], cache, 3600, 1)
+    second = scan_then_rename.check_images_cached(["nginx:1.25", "redis:7"], cache, 3600, 1)
+
+    assert [r["status"] for r in first] == ["MISSING", "OK"]
+    assert [r["status"] for r in second] == ["MISSING", "OK"]
+    assert calls == ["nginx:1.25", "redis:7"]
+
+
+def test_check_images_cached_requeries_expired(fake_checks):
+    calls, _ = fake_checks
+    cache = {"redis:7": {"exists": True, "detail": "exists", "checked_at": 0.0}}
+
+    scan_then_rename.check_images_cached(["redis:7"], cache, 60, 1)
+
+    assert calls == ["redis:7"]
+    assert cache["redis:7"]["checked_at"] > 0.0
+
+
+def test_check_images_cached_does_not_cache_errors(fake_checks):
+    calls, verdicts = fake_checks
+    verdicts["nginx:1.25"] = "[ERROR] Failed to get token for library/nginx: HTTP 503\nmissing"
+    cache = {}
+
+    for _ in range(2):
+        results = scan_then_rename.check_images_cached(["nginx:1.25"], cache, 3600, 1)
+        assert results[0]["status"] == "ERROR"
+
+    assert calls == ["nginx:1.25", "nginx:1.25"]
+    assert cache == {}
+
+
+def test_expired_charts():
+    charts_status = {
+        "/charts/old": {"scanned_at": 100.0},
+        "/charts/new": {"scanned_at": 950.0},
+    }
+    assert scan_then_rename.expired_charts(charts_status, 600, 1000.0) == {Path("/charts/old")}
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [["--poll-interval", "0"], ["--poll-interval", "-1"], ["--debounce", "-1"], ["--cache-ttl", "0"]],
+)
+def test_main_rejects_invalid_watch_options(tmp_path, flags):
+    with pytest.raises(SystemExit) as excinfo:
+        scan_then_rename.main([str(tmp_path), "--watch", *flags])
+    assert excinfo.value.code == 2